@@ -2,32 +2,90 @@
 Fibonacci Sequence Implementation in Python
 
 This module contains multiple implementations of the Fibonacci sequence:
-1. Recursive approach
-2. Iterative approach
+1. Recursive approach (fast doubling)
+2. Iterative approach (fast doubling)
 3. Generator approach
 4. Memoized recursive approach
 """
 
+import functools
+import math
+import operator
+
+import numpy as np
+
+_isqrt = math.isqrt
+
+# Largest n served by the memoized recursion before hitting the recursion limit
+_MEMO_MAX_N = 300
+
+# Bit r is set when r is a quadratic residue modulo 255 (= 3 * 5 * 17)
+_QR255_MASK = sum(1 << r for r in {i * i % 255 for i in range(255)})
+
+# Constants for Binet's formula F(n) = (phi^n - psi^n) / sqrt(5)
+SQRT5 = math.sqrt(5)
+PHI = (1 + SQRT5) / 2
+PSI = (1 - SQRT5) / 2
+
+# Largest count whose values F(0)..F(count-1) all fit in int64
+INT64_MAX_COUNT = 93
+
+# Largest n for which Binet's formula in float64 rounds to the exact value
+_BINET_MAX_N = 70
+
+# Largest |num| for which 5*num^2 + 4 and its square root checks fit in int64
+_IS_FIB_MANY_MAX = 10**9
+
+
+def _fib_pair(n):
+    """
+    Calculate the pair (F(n), F(n+1)) using the fast-doubling identities.
+    
+    F(2k) = F(k) * (2*F(k+1) - F(k))
+    F(2k+1) = F(k)^2 + F(k+1)^2
+    
+    Args:
+        n (int): Non-negative position in the Fibonacci sequence
+    
+    Returns:
+        tuple: (F(n), F(n+1))
+    
+    Time complexity: O(log n) multiplications
+    """
+    if n == 0:
+        return (0, 1)
+    
+    a, b = _fib_pair(n >> 1)
+    c = a * ((b << 1) - a)
+    d = a * a + b * b
+    if n & 1:
+        return (d, c + d)
+    return (c, d)
+
+
 def fibonacci_recursive(n):
     """
     Calculate the nth Fibonacci number using recursion.
     
+    Recurses on n // 2 via the fast-doubling helper instead of on n - 1 and
+    n - 2, so no subproblem is computed twice.
+    
     Args:
         n (int): Position in the Fibonacci sequence (0-indexed)
     
     Returns:
         int: The nth Fibonacci number
     
-    Note: This approach has exponential time complexity O(2^n)
+    Time complexity: O(log n) multiplications
     """
-    if n <= 1:
-        return n
-    return fibonacci_recursive(n - 1) + fibonacci_recursive(n - 2)
+    if n < len(_FIB_TABLE):
+        return _FIB_TABLE[n] if n >= 0 else n
+    return _fib_pair(n)[0]
 
 
 def fibonacci_iterative(n):
     """
-    Calculate the nth Fibonacci number using iteration.
+    Calculate the nth Fibonacci number using fast doubling.
     
     Args:
         n (int): Position in the Fibonacci sequence (0-indexed)
@@ -35,17 +93,12 @@ def fibonacci_iterative(n):
     Returns:
         int: The nth Fibonacci number
     
-    Time complexity: O(n)
-    Space complexity: O(1)
+    Time complexity: O(log n) multiplications
+    Space complexity: O(log n)
     """
-    if n <= 1:
-        return n
-    
-    a, b = 0, 1
-    for _ in range(2, n + 1):
-        a, b = b, a + b
-    
-    return b
+    if n < len(_FIB_TABLE):
+        return _FIB_TABLE[n] if n >= 0 else n
+    return _fib_pair(n)[0]
 
 
 def fibonacci_generator(count):
@@ -64,13 +117,37 @@ def fibonacci_generator(count):
         a, b = b, a + b
 
 
-def fibonacci_memoized(n, memo={}):
+# F(0)..F(93): every Fibonacci number below 2^64, served without computation
+_FIB_TABLE = tuple(fibonacci_generator(94))
+_FIB_SET = frozenset(_FIB_TABLE)
+
+
+@functools.lru_cache(maxsize=1024)
+def _fib_memo(n):
+    """
+    Memoized naive recursion backing fibonacci_memoized.
+    
+    Args:
+        n (int): Position in the Fibonacci sequence (0-indexed)
+    
+    Returns:
+        int: The nth Fibonacci number
+    """
+    if n <= 1:
+        return n
+    return _fib_memo(n - 1) + _fib_memo(n - 2)
+
+
+def fibonacci_memoized(n):
     """
     Calculate the nth Fibonacci number using memoization.
     
+    Results are kept in a bounded LRU cache shared by all callers. Positions
+    above _MEMO_MAX_N would recurse too deeply, so they are computed with
+    fast doubling instead.
+    
     Args:
         n (int): Position in the Fibonacci sequence (0-indexed)
-        memo (dict): Cache for previously calculated values
     
     Returns:
         int: The nth Fibonacci number
@@ -78,14 +155,11 @@ def fibonacci_memoized(n, memo={}):
     Time complexity: O(n)
     Space complexity: O(n)
     """
-    if n in memo:
-        return memo[n]
-    
-    if n <= 1:
-        return n
-    
-    memo[n] = fibonacci_memoized(n - 1, memo) + fibonacci_memoized(n - 2, memo)
-    return memo[n]
+    if 0 <= n < len(_FIB_TABLE):
+        return _FIB_TABLE[n]
+    if n > _MEMO_MAX_N:
+        return _fib_pair(n)[0]
+    return _fib_memo(n)
 
 
 def fibonacci_sequence(count):
@@ -100,18 +174,142 @@ def fibonacci_sequence(count):
     """
     if count <= 0:
         return []
-    elif count == 1:
-        return [0]
-    elif count == 2:
-        return [0, 1]
+    elif count <= len(_FIB_TABLE):
+        return list(_FIB_TABLE[:count])
     
-    sequence = [0, 1]
+    sequence = [0] * count
+    sequence[1] = 1
+    a, b = 0, 1
     for i in range(2, count):
-        sequence.append(sequence[i-1] + sequence[i-2])
+        a, b = b, a + b
+        sequence[i] = b
     
     return sequence
 
 
+def fibonacci_array(count):
+    """
+    Generate the first 'count' Fibonacci numbers as a NumPy array.
+    
+    Args:
+        count (int): Number of Fibonacci numbers to generate
+    
+    Returns:
+        numpy.ndarray: int64 array of Fibonacci numbers, or an object array of
+        Python ints when count exceeds the int64 range (count > 93)
+    """
+    dtype = np.int64 if count <= INT64_MAX_COUNT else object
+    return np.array(fibonacci_sequence(count), dtype=dtype)
+
+
+def fibonacci_many(ns):
+    """
+    Calculate F(n) for an array of positions in one vectorized pass.
+    
+    Uses Binet's closed form on float64, which is exact up to n = 70. If any
+    position is larger, every value is computed exactly with fast doubling
+    and an object array of Python ints is returned instead.
+    
+    Args:
+        ns (array_like): Non-negative integer positions in the Fibonacci sequence
+    
+    Returns:
+        numpy.ndarray: F(n) for each position, as int64 (or object for n > 70)
+    
+    Raises:
+        TypeError: If ns does not have an integer dtype
+        ValueError: If any position is negative
+    """
+    ns = np.asarray(ns)
+    if ns.size and ns.dtype.kind not in 'iu':
+        raise TypeError(f"fibonacci_many expects integer positions, got dtype {ns.dtype}")
+    ns = ns.astype(np.int64)
+    if ns.size and ns.min() < 0:
+        raise ValueError(f"positions must be non-negative, got {ns.min()}")
+    if ns.size and ns.max() > _BINET_MAX_N:
+        values = [fibonacci_iterative(int(n)) for n in ns.ravel()]
+        return np.array(values, dtype=object).reshape(ns.shape)
+    return np.rint((PHI ** ns - PSI ** ns) / SQRT5).astype(np.int64)
+
+
+def _mat_mul_mod(A, B, m):
+    """
+    Multiply two 2x2 matrices modulo m.
+    
+    Args:
+        A (tuple): Left matrix as a flat (a, b, c, d) tuple in row-major order
+        B (tuple): Right matrix in the same layout
+        m (int): Positive modulus
+    
+    Returns:
+        tuple: The product A*B modulo m, in the same layout
+    """
+    a, b, c, d = A
+    e, f, g, h = B
+    return ((a * e + b * g) % m, (a * f + b * h) % m,
+            (c * e + d * g) % m, (c * f + d * h) % m)
+
+
+def fibonacci_mod(n, m):
+    """
+    Calculate the nth Fibonacci number modulo m using matrix exponentiation.
+    
+    Raises [[1, 1], [1, 0]] to the nth power by repeated squaring, reducing
+    modulo m at every step so the operands never grow beyond m^2.
+    
+    Args:
+        n (int): Non-negative position in the Fibonacci sequence
+        m (int): Positive modulus
+    
+    Returns:
+        int: F(n) mod m
+    
+    Raises:
+        ValueError: If n is negative or m is less than 1
+    
+    Time complexity: O(log n) multiplications of numbers below m
+    """
+    if n < 0:
+        raise ValueError(f"n must be non-negative, got {n}")
+    if m < 1:
+        raise ValueError(f"m must be positive, got {m}")
+    
+    result = (1, 0, 0, 1)
+    base = (1, 1, 1, 0)
+    while n:
+        if n & 1:
+            result = _mat_mul_mod(result, base, m)
+        base = _mat_mul_mod(base, base, m)
+        n >>= 1
+    return result[1]
+
+
+def _is_perfect_square(n):
+    """
+    Check if a non-negative integer is a perfect square.
+    
+    Cheap modular filters reject most non-squares first; survivors are
+    confirmed with math.isqrt, so the check stays exact for arbitrarily large
+    integers.
+    
+    Args:
+        n (int): Number to check
+    
+    Returns:
+        bool: True if n is a perfect square, False otherwise
+    """
+    if n < 0:
+        return False
+    # Squares are 0, 1, 4 or 9 mod 16 and hit only 54 of the 255 residues
+    # mod 255, so most non-squares are rejected before the isqrt
+    if (n & 15) not in (0, 1, 4, 9):
+        return False
+    if not (_QR255_MASK >> (n % 255)) & 1:
+        return False
+    root = _isqrt(n)
+    return root * root == n
+
+
 def is_fibonacci(num):
     """
     Check if a number is a Fibonacci number.
@@ -124,15 +322,83 @@ def is_fibonacci(num):
     Returns:
         bool: True if the number is a Fibonacci number, False otherwise
     """
-    import math
+    if 0 <= num <= _FIB_TABLE[-1]:
+        return num in _FIB_SET
+    
+    x = 5 * num * num
+    return _is_perfect_square(x + 4) or _is_perfect_square(x - 4)
+
+
+def _is_perfect_square_many(values):
+    """
+    Check which entries of an int64 array are perfect squares.
     
-    def is_perfect_square(n):
-        if n < 0:
-            return False
-        root = int(math.sqrt(n))
-        return root * root == n
+    The float64 square root is within one of the exact integer root for any
+    int64 input, so the neighbouring candidates are checked as well.
     
-    return is_perfect_square(5 * num * num + 4) or is_perfect_square(5 * num * num - 4)
+    Args:
+        values (numpy.ndarray): int64 array of numbers to check
+    
+    Returns:
+        numpy.ndarray: Boolean array, True where the entry is a perfect square
+    """
+    root = np.sqrt(np.maximum(values, 0)).astype(np.int64)
+    is_square = root * root == values
+    is_square |= (root + 1) * (root + 1) == values
+    is_square |= (root - 1) * (root - 1) == values
+    return is_square & (values >= 0)
+
+
+def is_fibonacci_many(nums):
+    """
+    Check which numbers in an array are Fibonacci numbers in one vectorized pass.
+    
+    Applies the same 5*n^2 +/- 4 perfect-square test as is_fibonacci on int64
+    arrays. Inputs with |num| above 10^9 would overflow int64, so they fall
+    back to the exact scalar check.
+    
+    Args:
+        nums (array_like): Integers to check
+    
+    Returns:
+        numpy.ndarray: Boolean array, True where the number is a Fibonacci number
+    
+    Raises:
+        TypeError: If nums does not have an integer dtype, or holds a non-integer
+            object
+    """
+    nums = np.asarray(nums)
+    if nums.size and nums.dtype.kind not in 'iubO':
+        raise TypeError(f"is_fibonacci_many expects integers, got dtype {nums.dtype}")
+    if nums.dtype == object or (nums.size and np.abs(nums).max() > _IS_FIB_MANY_MAX):
+        flags = [is_fibonacci(operator.index(num)) for num in nums.ravel()]
+        return np.array(flags, dtype=bool).reshape(nums.shape)
+    
+    a = nums.astype(np.int64)
+    x = 5 * a * a
+    return _is_perfect_square_many(x + 4) | _is_perfect_square_many(x - 4)
+
+
+def fibonacci_set_upto(limit):
+    """
+    Build the set of all Fibonacci numbers less than or equal to a limit.
+    
+    Useful for testing many numbers at once: building the set is O(k) for
+    the k Fibonacci numbers up to the limit, after which each membership
+    test is a single hash lookup.
+    
+    Args:
+        limit (int): Largest value to include
+    
+    Returns:
+        set: Fibonacci numbers up to and including limit
+    """
+    fibs = set()
+    a, b = 0, 1
+    while a <= limit:
+        fibs.add(a)
+        a, b = b, a + b
+    return fibs
 
 
 def main():
@@ -146,24 +412,33 @@ def main():
     
     # Using generator
     print("Using generator:")
-    fib_gen = fibonacci_generator(n)
-    print([next(fib_gen) for _ in range(n)])
+    print(list(fibonacci_generator(n)))
     
     # Using sequence function
     print("\nUsing sequence function:")
     print(fibonacci_sequence(n))
     
+    # Using array function
+    print("\nUsing array function:")
+    print(fibonacci_array(n).tolist())
+    
+    # Using vectorized closed form
+    print("\nUsing vectorized Binet formula:")
+    print(fibonacci_many(range(n)).tolist())
+    
     # Individual calculations
     print(f"\nFibonacci number at position {n-1}:")
     print(f"Recursive: {fibonacci_recursive(n-1)}")
     print(f"Iterative: {fibonacci_iterative(n-1)}")
     print(f"Memoized: {fibonacci_memoized(n-1)}")
+    print(f"Modulo 7: {fibonacci_mod(n-1, 7)}")
     
     # Check if numbers are Fibonacci
     print(f"\nChecking if numbers are Fibonacci:")
     test_numbers = [0, 1, 2, 3, 4, 5, 8, 13, 21, 34, 35]
+    fibs = fibonacci_set_upto(max(test_numbers))
     for num in test_numbers:
-        print(f"{num}: {is_fibonacci(num)}")
+        print(f"{num}: {num in fibs}")
 
 
 if __name__ == "__main__":
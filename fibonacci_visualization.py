@@ -5,211 +5,398 @@ This module provides visualization tools for the Fibonacci sequence using matplo
 It includes line plots, bar charts, spiral visualizations, and golden ratio analysis.
 """
 
+import functools
+import os
+import matplotlib
+
+# Set FIB_NOSHOW=1 to render headless with Agg and save PNGs instead of showing windows
+_NOSHOW = os.environ.get('FIB_NOSHOW') == '1'
+if _NOSHOW:
+    matplotlib.use('Agg')
+
 import matplotlib.pyplot as plt
 import numpy as np
 import math
-from fibonacci import fibonacci_sequence, fibonacci_iterative
+from matplotlib.collections import LineCollection, PatchCollection
+from fibonacci import INT64_MAX_COUNT, PHI, PSI, SQRT5, fibonacci_array, fibonacci_iterative
+
+# Legend labels for the golden ratio, formatted once
+_PHI_LABEL = f'Golden Ratio (φ = {PHI:.6f})'
+_PHI_SHORT_LABEL = f'φ = {PHI:.3f}'
+
+# psi / phi from Binet's formula, and the base-10 logarithms used to plot growth
+_PSI_OVER_PHI = PSI / PHI
+_LOG10_PHI = math.log10(PHI)
+_LOG10_SQRT5 = math.log10(SQRT5)
+_LOG10_2 = math.log10(2)
+
+# Spiral geometry per direction right, up, left, down, in units of the square's
+# side: the step to the next position, the square's lower-left corner and its
+# arc centre relative to the current position, and the label relative to the
+# next position
+_SPIRAL_STEPS = np.array([(1, 0), (0, 1), (-1, 0), (0, -1)])
+_SPIRAL_CORNERS = np.array([(0, 0), (-1, 0), (-1, -1), (0, -1)])
+_SPIRAL_CENTERS = np.array([(1, 0), (-1, 1), (-1, -1), (0, -1)])
+_SPIRAL_LABELS = np.array([(-0.5, 0.5), (-0.5, -0.5), (0.5, -0.5), (0.5, 0.5)])
+
+# Maps (cos, sin) of the unit quarter arc onto each direction's quadrant
+_ARC_TRANSFORMS = np.array([[(-1, 0), (0, 1)], [(0, -1), (1, 0)],
+                            [(-1, 0), (0, -1)], [(0, 1), (-1, 0)]])
+
+# Bounds on the number of samples per spiral quarter arc
+_ARC_MIN_POINTS = 16
+_ARC_MAX_POINTS = 100
+
+
+def _finalize(fig, name):
+    """
+    Display a finished figure, or save it as '<name>.png' when FIB_NOSHOW is set.
+    
+    The figure is closed afterwards so pyplot releases its canvas.
+    
+    Args:
+        fig (matplotlib.figure.Figure): Figure to display or save
+        name (str): File name stem used when saving
+    """
+    if _NOSHOW:
+        fig.savefig(f'{name}.png', dpi=100)
+    else:
+        plt.show()
+    plt.close(fig)
+
+
+@functools.lru_cache(maxsize=None)
+def _quarter_arcs(points):
+    """
+    Sample the spiral's quarter arc once and map it into all four directions.
+    
+    Args:
+        points (int): Number of samples along the arc
+    
+    Returns:
+        numpy.ndarray: (4, points, 2) unit arc vertices for each direction
+        right, up, left, down, relative to the arc centre
+    """
+    theta = np.linspace(0, np.pi/2, points)
+    unit_arc = np.stack([np.cos(theta), np.sin(theta)])
+    arcs = (_ARC_TRANSFORMS @ unit_arc).transpose(0, 2, 1)
+    arcs.setflags(write=False)
+    return arcs
+
+
+def _prepare_axes(ax, figsize, show):
+    """
+    Create a new figure and axes, or clear and reuse the axes given by the caller.
+    
+    A figure drawn into the caller's axes belongs to the caller, so by default
+    it is not finalized: _finalize would block in plt.show() and then close it.
+    
+    Args:
+        ax (matplotlib.axes.Axes or None): Axes to reuse, or None for a new figure
+        figsize (tuple): Size of the new figure in inches
+        show (bool or None): Whether to finalize the figure, or None to do so
+            only for a new figure
+    
+    Returns:
+        tuple: (figure, axes, show) to draw into, with show resolved to a bool
+    """
+    if show is None:
+        show = ax is None
+    if ax is None:
+        fig, ax = plt.subplots(figsize=figsize, layout='constrained')
+        return fig, ax, show
+    ax.clear()
+    return ax.figure, ax, show
+
+
+def _consecutive_ratios(n):
+    """
+    Compute F(n+1)/F(n) from Binet's formula without forming F(n).
+    
+    F(n+1)/F(n) = phi + sqrt(5) * r^n / (1 - r^n) with r = psi/phi, so the
+    ratios stay in float64 for any n instead of dividing large integers.
+    
+    Args:
+        n (numpy.ndarray): Positions n >= 1
+    
+    Returns:
+        numpy.ndarray: Ratios F(n+1)/F(n)
+    """
+    r_n = _PSI_OVER_PHI ** n
+    return PHI + SQRT5 * r_n / (1 - r_n)
+
+
+@functools.lru_cache(maxsize=32)
+def _viridis(n):
+    """
+    Sample n evenly spaced colors from the viridis colormap, cached per n.
+    
+    Args:
+        n (int): Number of colors
+    
+    Returns:
+        numpy.ndarray: Read-only (n, 4) array of RGBA colors
+    """
+    colors = plt.cm.viridis(np.linspace(0, 1, n))
+    colors.setflags(write=False)
+    return colors
+
+
+# Longest Fibonacci prefix requested so far, shared by all plotting functions
+_fib_cache = np.zeros(0, dtype=np.int64)
+
+
+def _fib_array(count):
+    """
+    Return the first 'count' Fibonacci numbers as a NumPy array.
+    
+    Plotting functions pass this straight to matplotlib, which would otherwise
+    convert a list of Python ints element by element on every call. All of
+    them share one read-only int64 array holding the longest prefix requested
+    so far: shorter requests are served as views into it, and longer ones
+    grow it once to the new length. Counts beyond the int64 range need an
+    object array of Python ints and are built on each call instead.
+    
+    Args:
+        count (int): Number of Fibonacci numbers to return
+    
+    Returns:
+        numpy.ndarray: Read-only int64 array of Fibonacci numbers, or an object
+        array of Python ints when count exceeds the int64 range (count > 93)
+    """
+    global _fib_cache
+    if count > INT64_MAX_COUNT:
+        fib_arr = fibonacci_array(count)
+        fib_arr.setflags(write=False)
+        return fib_arr
+    if count > len(_fib_cache):
+        _fib_cache = fibonacci_array(count)
+        _fib_cache.setflags(write=False)
+    return _fib_cache[:max(count, 0)]
+
+
+def _fib_log10(n):
+    """
+    Compute log10 F(n) from Binet's formula without forming F(n).
+    
+    F(n) = phi^n * (1 - r^n) / sqrt(5) with r = psi/phi, so the logarithm
+    n*log10(phi) - log10(sqrt(5)) + log10(1 - r^n) stays finite in float64
+    for any n >= 1, where F(n) itself overflows beyond n = 1476.
+    
+    Args:
+        n (numpy.ndarray): Non-negative positions
+    
+    Returns:
+        numpy.ndarray: log10 F(n), with -inf for F(0) = 0
+    """
+    with np.errstate(divide='ignore'):
+        return n * _LOG10_PHI - _LOG10_SQRT5 + np.log10(1 - _PSI_OVER_PHI ** n)
 
 
-def plot_fibonacci_sequence(count=20):
+def plot_fibonacci_sequence(count=20, show=None, ax=None):
     """
     Plot the Fibonacci sequence as a line chart.
     
     Args:
         count (int): Number of Fibonacci numbers to plot
-    """
-    fib_numbers = fibonacci_sequence(count)
-    indices = list(range(count))
+        show (bool, optional): Whether to display (or, with FIB_NOSHOW, save) the
+            figure; defaults to True unless ax is given
+        ax (matplotlib.axes.Axes, optional): Existing axes to clear and draw into
+            instead of creating a new figure
     
-    plt.figure(figsize=(12, 6))
-    plt.plot(indices, fib_numbers, 'b-o', linewidth=2, markersize=6)
-    plt.title(f'Fibonacci Sequence (First {count} Numbers)', fontsize=16)
-    plt.xlabel('Index (n)', fontsize=12)
-    plt.ylabel('Fibonacci Number F(n)', fontsize=12)
-    plt.grid(True, alpha=0.3)
-    plt.tight_layout()
-    plt.show()
+    Returns:
+        matplotlib.figure.Figure: The figure containing the plot
+    """
+    fib_numbers = _fib_array(count)
+    indices = np.arange(count)
+    
+    fig, ax, show = _prepare_axes(ax, (12, 6), show)
+    ax.plot(indices, fib_numbers, 'b-o', linewidth=2, markersize=6)
+    ax.set_title(f'Fibonacci Sequence (First {count} Numbers)', fontsize=16)
+    ax.set_xlabel('Index (n)', fontsize=12)
+    ax.set_ylabel('Fibonacci Number F(n)', fontsize=12)
+    ax.grid(True, alpha=0.3)
+    if show:
+        _finalize(fig, 'fibonacci_line_plot')
+    return fig
 
 
-def plot_fibonacci_bar_chart(count=15):
+def plot_fibonacci_bar_chart(count=15, show=None, ax=None):
     """
     Plot the Fibonacci sequence as a bar chart.
     
     Args:
         count (int): Number of Fibonacci numbers to plot
+        show (bool, optional): Whether to display (or, with FIB_NOSHOW, save) the
+            figure; defaults to True unless ax is given
+        ax (matplotlib.axes.Axes, optional): Existing axes to clear and draw into
+            instead of creating a new figure
+    
+    Returns:
+        matplotlib.figure.Figure: The figure containing the plot
     """
-    fib_numbers = fibonacci_sequence(count)
-    indices = list(range(count))
+    fib_numbers = _fib_array(count)
+    indices = np.arange(count)
     
-    plt.figure(figsize=(12, 6))
-    bars = plt.bar(indices, fib_numbers, color='skyblue', alpha=0.8, edgecolor='navy')
-    plt.title(f'Fibonacci Sequence Bar Chart (First {count} Numbers)', fontsize=16)
-    plt.xlabel('Index (n)', fontsize=12)
-    plt.ylabel('Fibonacci Number F(n)', fontsize=12)
-    plt.grid(True, alpha=0.3, axis='y')
+    fig, ax, show = _prepare_axes(ax, (12, 6), show)
+    bars = ax.bar(indices, fib_numbers, color='skyblue', alpha=0.8, edgecolor='navy')
+    ax.set_title(f'Fibonacci Sequence Bar Chart (First {count} Numbers)', fontsize=16)
+    ax.set_xlabel('Index (n)', fontsize=12)
+    ax.set_ylabel('Fibonacci Number F(n)', fontsize=12)
+    ax.grid(True, alpha=0.3, axis='y')
     
     # Add value labels on bars
-    for bar, value in zip(bars, fib_numbers):
-        plt.text(bar.get_x() + bar.get_width()/2, bar.get_height() + max(fib_numbers)*0.01,
-                str(value), ha='center', va='bottom', fontsize=9)
+    ax.bar_label(bars, labels=[str(value) for value in fib_numbers], padding=3, fontsize=9)
     
-    plt.tight_layout()
-    plt.show()
+    if show:
+        _finalize(fig, 'fibonacci_bar_chart')
+    return fig
 
 
-def plot_fibonacci_spiral(count=10):
+def plot_fibonacci_spiral(count=10, show=None, ax=None):
     """
     Plot the Fibonacci spiral using squares with side lengths equal to Fibonacci numbers.
     
     Args:
         count (int): Number of Fibonacci numbers to use for the spiral
-    """
-    fib_numbers = fibonacci_sequence(count)
-    
-    fig, ax = plt.subplots(figsize=(10, 10))
-    
-    # Starting position and direction
-    x, y = 0, 0
-    direction = 0  # 0: right, 1: up, 2: left, 3: down
-    
-    colors = plt.cm.viridis(np.linspace(0, 1, count))
-    
-    for i, fib_num in enumerate(fib_numbers):
-        if fib_num == 0:
-            continue
-            
-        # Draw square
-        if direction == 0:  # right
-            square = plt.Rectangle((x, y), fib_num, fib_num, 
-                                 fill=False, edgecolor=colors[i], linewidth=2)
-            # Draw quarter circle
-            theta = np.linspace(0, np.pi/2, 100)
-            circle_x = x + fib_num - fib_num * np.cos(theta)
-            circle_y = y + fib_num * np.sin(theta)
-            ax.plot(circle_x, circle_y, color=colors[i], linewidth=2)
-            x += fib_num
-        elif direction == 1:  # up
-            square = plt.Rectangle((x-fib_num, y), fib_num, fib_num, 
-                                 fill=False, edgecolor=colors[i], linewidth=2)
-            theta = np.linspace(np.pi/2, np.pi, 100)
-            circle_x = x - fib_num + fib_num * np.cos(theta)
-            circle_y = y + fib_num + fib_num * np.sin(theta)
-            ax.plot(circle_x, circle_y, color=colors[i], linewidth=2)
-            y += fib_num
-        elif direction == 2:  # left
-            square = plt.Rectangle((x-fib_num, y-fib_num), fib_num, fib_num, 
-                                 fill=False, edgecolor=colors[i], linewidth=2)
-            theta = np.linspace(np.pi, 3*np.pi/2, 100)
-            circle_x = x - fib_num + fib_num * np.cos(theta)
-            circle_y = y - fib_num + fib_num * np.sin(theta)
-            ax.plot(circle_x, circle_y, color=colors[i], linewidth=2)
-            x -= fib_num
-        else:  # down (direction == 3)
-            square = plt.Rectangle((x, y-fib_num), fib_num, fib_num, 
-                                 fill=False, edgecolor=colors[i], linewidth=2)
-            theta = np.linspace(3*np.pi/2, 2*np.pi, 100)
-            circle_x = x + fib_num * np.cos(theta)
-            circle_y = y - fib_num + fib_num * np.sin(theta)
-            ax.plot(circle_x, circle_y, color=colors[i], linewidth=2)
-            y -= fib_num
-        
-        ax.add_patch(square)
-        
-        # Add text label
-        if direction == 0:
-            ax.text(x - fib_num/2, y + fib_num/2, str(fib_num), 
-                   ha='center', va='center', fontsize=10, fontweight='bold')
-        elif direction == 1:
-            ax.text(x - fib_num/2, y - fib_num/2, str(fib_num), 
-                   ha='center', va='center', fontsize=10, fontweight='bold')
-        elif direction == 2:
-            ax.text(x + fib_num/2, y - fib_num/2, str(fib_num), 
-                   ha='center', va='center', fontsize=10, fontweight='bold')
-        else:
-            ax.text(x + fib_num/2, y + fib_num/2, str(fib_num), 
-                   ha='center', va='center', fontsize=10, fontweight='bold')
-        
-        direction = (direction + 1) % 4
+        show (bool, optional): Whether to display (or, with FIB_NOSHOW, save) the
+            figure; defaults to True unless ax is given
+        ax (matplotlib.axes.Axes, optional): Existing axes to clear and draw into
+            instead of creating a new figure
     
+    Returns:
+        matplotlib.figure.Figure: The figure containing the plot
+    """
+    fib_numbers = _fib_array(count)
+    
+    fig, ax, show = _prepare_axes(ax, (10, 10), show)
+    
+    # Only F(0) is zero, so the squares start from F(1). Directions cycle
+    # right, up, left, down, and each square's position follows from the
+    # cumulative steps of the squares before it.
+    values = fib_numbers[1:]
+    sides = np.array(values, dtype=float)[:, None]
+    directions = np.arange(len(values)) % 4
+    steps = _SPIRAL_STEPS[directions] * sides
+    ends = np.cumsum(steps, axis=0)
+    starts = ends - steps
+    corners = starts + _SPIRAL_CORNERS[directions] * sides
+    centers = starts + _SPIRAL_CENTERS[directions] * sides
+    label_positions = ends + _SPIRAL_LABELS[directions] * sides
+    
+    colors = _viridis(count)[1:]
+    squares = [plt.Rectangle(corner, side, side, fill=False, edgecolor=color, linewidth=2)
+               for corner, side, color in zip(corners, values, colors)]
+    
+    # Small arcs need far fewer vertices than large ones to look smooth
+    arcs = []
+    for center, side, direction in zip(centers, values, directions):
+        points = min(_ARC_MAX_POINTS, max(_ARC_MIN_POINTS, int(4 * math.sqrt(side))))
+        arcs.append(center + side * _quarter_arcs(points)[direction])
+    
+    for (label_x, label_y), value in zip(label_positions, values):
+        ax.text(label_x, label_y, str(value),
+               ha='center', va='center', fontsize=10, fontweight='bold')
+    
+    # Draw all squares and arcs as two collections instead of one artist each
+    ax.add_collection(PatchCollection(squares, match_original=True))
+    ax.add_collection(LineCollection(arcs, colors=colors, linewidths=2))
+    # Before matplotlib 3.11, add_collection only updates the data limits
+    ax.autoscale_view()
     ax.set_aspect('equal')
     ax.set_title('Fibonacci Spiral', fontsize=16)
     ax.grid(True, alpha=0.3)
-    plt.tight_layout()
-    plt.show()
+    if show:
+        _finalize(fig, 'fibonacci_spiral')
+    return fig
 
 
-def plot_golden_ratio_convergence(count=20):
+def plot_golden_ratio_convergence(count=20, show=None, ax=None):
     """
     Plot how the ratio of consecutive Fibonacci numbers converges to the golden ratio.
     
     Args:
         count (int): Number of ratios to calculate and plot
-    """
-    fib_numbers = fibonacci_sequence(count + 1)
-    ratios = []
-    
-    for i in range(1, len(fib_numbers)):
-        if fib_numbers[i-1] != 0:
-            ratio = fib_numbers[i] / fib_numbers[i-1]
-            ratios.append(ratio)
+        show (bool, optional): Whether to display (or, with FIB_NOSHOW, save) the
+            figure; defaults to True unless ax is given
+        ax (matplotlib.axes.Axes, optional): Existing axes to clear and draw into
+            instead of creating a new figure
     
-    golden_ratio = (1 + math.sqrt(5)) / 2
+    Returns:
+        matplotlib.figure.Figure: The figure containing the plot
+    """
+    n = np.arange(1, count)
+    ratios = _consecutive_ratios(n)
     
-    plt.figure(figsize=(12, 6))
-    plt.plot(range(1, len(ratios) + 1), ratios, 'b-o', linewidth=2, markersize=6, label='F(n+1)/F(n)')
-    plt.axhline(y=golden_ratio, color='r', linestyle='--', linewidth=2, label=f'Golden Ratio (φ = {golden_ratio:.6f})')
+    fig, ax, show = _prepare_axes(ax, (12, 6), show)
+    ax.plot(n, ratios, 'b-o', linewidth=2, markersize=6, label='F(n+1)/F(n)')
+    ax.axhline(y=PHI, color='r', linestyle='--', linewidth=2, label=_PHI_LABEL)
     
-    plt.title('Convergence to Golden Ratio', fontsize=16)
-    plt.xlabel('n', fontsize=12)
-    plt.ylabel('Ratio F(n+1)/F(n)', fontsize=12)
-    plt.legend()
-    plt.grid(True, alpha=0.3)
-    plt.tight_layout()
-    plt.show()
+    ax.set_title('Convergence to Golden Ratio', fontsize=16)
+    ax.set_xlabel('n', fontsize=12)
+    ax.set_ylabel('Ratio F(n+1)/F(n)', fontsize=12)
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+    if show:
+        _finalize(fig, 'golden_ratio_convergence')
+    return fig
 
 
-def plot_fibonacci_growth_comparison(count=15):
+def plot_fibonacci_growth_comparison(count=15, show=None, ax=None):
     """
     Compare Fibonacci growth with exponential and polynomial functions.
     
     Args:
         count (int): Number of points to plot
-    """
-    fib_numbers = fibonacci_sequence(count)
-    indices = list(range(count))
-    
-    # Generate comparison functions
-    exponential = [2**i for i in indices]
-    polynomial = [i**2 for i in indices]
-    
-    plt.figure(figsize=(12, 8))
+        show (bool, optional): Whether to display (or, with FIB_NOSHOW, save) the
+            figure; defaults to True unless ax is given
+        ax (matplotlib.axes.Axes, optional): Existing axes to clear and draw into
+            instead of creating a new figure
     
-    # Use log scale for better comparison
-    plt.semilogy(indices, fib_numbers, 'b-o', linewidth=2, markersize=6, label='Fibonacci')
-    plt.semilogy(indices, exponential, 'r--', linewidth=2, label='2^n')
-    plt.semilogy(indices, polynomial, 'g:', linewidth=2, label='n^2')
-    
-    plt.title('Fibonacci Growth Comparison (Log Scale)', fontsize=16)
-    plt.xlabel('Index (n)', fontsize=12)
-    plt.ylabel('Value (log scale)', fontsize=12)
-    plt.legend()
-    plt.grid(True, alpha=0.3)
-    plt.tight_layout()
-    plt.show()
+    Returns:
+        matplotlib.figure.Figure: The figure containing the plot
+    """
+    indices = np.arange(count)
+    
+    # Plot log10 of every curve on a linear axis: the logarithms come from
+    # closed forms and stay finite for any count, where the values themselves
+    # overflow float64 and matplotlib's log-scale ticker
+    fib_log = _fib_log10(indices)
+    exponential_log = indices * _LOG10_2
+    with np.errstate(divide='ignore'):
+        polynomial_log = 2 * np.log10(indices)
+    
+    fig, ax, show = _prepare_axes(ax, (12, 8), show)
+    ax.plot(indices, fib_log, 'b-o', linewidth=2, markersize=6, label='Fibonacci')
+    ax.plot(indices, exponential_log, 'r--', linewidth=2, label='2^n')
+    ax.plot(indices, polynomial_log, 'g:', linewidth=2, label='n^2')
+    
+    ax.set_title('Fibonacci Growth Comparison (Log Scale)', fontsize=16)
+    ax.set_xlabel('Index (n)', fontsize=12)
+    ax.set_ylabel('log10(value)', fontsize=12)
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+    if show:
+        _finalize(fig, 'fibonacci_growth_comparison')
+    return fig
 
 
-def create_fibonacci_dashboard(count=15):
+def create_fibonacci_dashboard(count=15, show=True):
     """
     Create a comprehensive dashboard with multiple Fibonacci visualizations.
     
     Args:
         count (int): Number of Fibonacci numbers to use
+        show (bool): Whether to display (or, with FIB_NOSHOW, save) the figure
+    
+    Returns:
+        matplotlib.figure.Figure: The created figure
     """
-    fib_numbers = fibonacci_sequence(count)
-    indices = list(range(count))
+    fib_numbers = _fib_array(count)
+    indices = np.arange(count)
     
     # Create subplots
-    fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 12))
+    fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 12), layout='constrained')
     
     # 1. Line plot
     ax1.plot(indices, fib_numbers, 'b-o', linewidth=2, markersize=4)
@@ -226,15 +413,11 @@ def create_fibonacci_dashboard(count=15):
     ax2.grid(True, alpha=0.3, axis='y')
     
     # 3. Golden ratio convergence
-    ratios = []
-    for i in range(1, len(fib_numbers)):
-        if fib_numbers[i-1] != 0:
-            ratio = fib_numbers[i] / fib_numbers[i-1]
-            ratios.append(ratio)
-    
-    golden_ratio = (1 + math.sqrt(5)) / 2
-    ax3.plot(range(1, len(ratios) + 1), ratios, 'g-o', linewidth=2, markersize=4)
-    ax3.axhline(y=golden_ratio, color='r', linestyle='--', linewidth=2, label=f'φ = {golden_ratio:.3f}')
+    n = np.arange(1, count - 1)
+    ratios = _consecutive_ratios(n)
+    
+    ax3.plot(n, ratios, 'g-o', linewidth=2, markersize=4)
+    ax3.axhline(y=PHI, color='r', linestyle='--', linewidth=2, label=_PHI_SHORT_LABEL)
     ax3.set_title('Golden Ratio Convergence', fontsize=14)
     ax3.set_xlabel('n')
     ax3.set_ylabel('F(n+1)/F(n)')
@@ -242,7 +425,7 @@ def create_fibonacci_dashboard(count=15):
     ax3.grid(True, alpha=0.3)
     
     # 4. Log scale comparison
-    exponential = [2**i for i in indices]
+    exponential = np.exp2(indices)
     ax4.semilogy(indices, fib_numbers, 'b-o', linewidth=2, markersize=4, label='Fibonacci')
     ax4.semilogy(indices, exponential, 'r--', linewidth=2, label='2^n')
     ax4.set_title('Growth Comparison (Log Scale)', fontsize=14)
@@ -251,8 +434,9 @@ def create_fibonacci_dashboard(count=15):
     ax4.legend()
     ax4.grid(True, alpha=0.3)
     
-    plt.tight_layout()
-    plt.show()
+    if show:
+        _finalize(fig, 'fibonacci_dashboard')
+    return fig
 
 
 def main():
@@ -261,24 +445,33 @@ def main():
     """
     print("Fibonacci Sequence Visualizations\n")
     
-    # Create individual plots
+    # Create individual plots, then display or save them all at once
+    figures = {}
     print("1. Line plot of Fibonacci sequence...")
-    plot_fibonacci_sequence(20)
+    figures['fibonacci_line_plot'] = plot_fibonacci_sequence(20, show=False)
     
     print("2. Bar chart of Fibonacci numbers...")
-    plot_fibonacci_bar_chart(15)
+    figures['fibonacci_bar_chart'] = plot_fibonacci_bar_chart(15, show=False)
     
     print("3. Fibonacci spiral...")
-    plot_fibonacci_spiral(8)
+    figures['fibonacci_spiral'] = plot_fibonacci_spiral(8, show=False)
     
     print("4. Golden ratio convergence...")
-    plot_golden_ratio_convergence(20)
+    figures['golden_ratio_convergence'] = plot_golden_ratio_convergence(20, show=False)
     
     print("5. Growth comparison...")
-    plot_fibonacci_growth_comparison(15)
+    figures['fibonacci_growth_comparison'] = plot_fibonacci_growth_comparison(15, show=False)
     
     print("6. Comprehensive dashboard...")
-    create_fibonacci_dashboard(15)
+    figures['fibonacci_dashboard'] = create_fibonacci_dashboard(15, show=False)
+    
+    if _NOSHOW:
+        for name, fig in figures.items():
+            _finalize(fig, name)
+    else:
+        plt.show()
+        for fig in figures.values():
+            plt.close(fig)
 
 
 if __name__ == "__main__":